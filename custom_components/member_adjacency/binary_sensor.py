@@ -10,9 +10,8 @@ in building automations.
 from __future__ import annotations
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import DOMAIN, DEFAULT_NAME_KO
 from .manager import AdjacencyManager
@@ -22,16 +21,17 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities) -> N
     """Set up the Member Adjacency binary sensor for a config entry."""
     mgr: AdjacencyManager = hass.data[DOMAIN][entry.entry_id]
 
+    # Pre-check keeps reloads off async_get_or_create's create path
     ent_reg = er.async_get(hass)
-    pair_key = mgr.pair_key
-
-    ent_reg.async_get_or_create(
-        "binary_sensor",
-        DOMAIN,
-        f"{entry.entry_id}_proximity",
-        suggested_object_id=f"member_adjacency_{pair_key}_proximity",
-        config_entry=entry,
-    )
+    unique_id = f"{entry.entry_id}_proximity"
+    if ent_reg.async_get_entity_id("binary_sensor", DOMAIN, unique_id) is None:
+        ent_reg.async_get_or_create(
+            "binary_sensor",
+            DOMAIN,
+            unique_id,
+            suggested_object_id=f"member_adjacency_{mgr.pair_key}_proximity",
+            config_entry=entry,
+        )
 
     async_add_entities([MemberAdjacencyProximityBinary(mgr)])
 
@@ -39,6 +39,8 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities) -> N
 class MemberAdjacencyProximityBinary(BinarySensorEntity):
     """Binary sensor indicating if the two entities are in proximity."""
 
+    __slots__ = ("mgr", "_unsub")
+
     _attr_should_poll = False
     _attr_icon = "mdi:map-marker-circle"
 
@@ -49,11 +51,9 @@ class MemberAdjacencyProximityBinary(BinarySensorEntity):
         self._unsub = None
 
     async def async_added_to_hass(self) -> None:
-        @callback
-        def _updated() -> None:
-            self.async_write_ha_state()
-
-        self._unsub = async_dispatcher_connect(self.hass, self.mgr.signal, _updated)
+        # async_write_ha_state is itself a @callback; register the bound
+        # method directly rather than allocating a closure per entity
+        self._unsub = self.mgr.async_add_listener(self.async_write_ha_state)
         self.async_on_remove(self._unsub)
 
     @property
@@ -66,56 +66,47 @@ class MemberAdjacencyProximityBinary(BinarySensorEntity):
 
     @property
     def extra_state_attributes(self):
+        mgr = self.mgr
+        data = mgr.data
+        # shared values computed once; legacy aliases reference the same objects
+        speed_a = None if mgr.a_speed_kmh is None else round(mgr.a_speed_kmh, 1)
+        speed_b = None if mgr.b_speed_kmh is None else round(mgr.b_speed_kmh, 1)
+        a_fix = mgr.a_last_fix_iso
+        b_fix = mgr.b_last_fix_iso
+
         return {
+            # entity ids + configuration (rebuilt only on options change)
+            **mgr.static_attrs,
             # New semantic naming (기준점/추적대상)
-            "base_entity": self.mgr.base_entity,
-            "tracker_entity": self.mgr.tracker_entity,
-            "base_speed_kmh": None if self.mgr.a_speed_kmh is None else round(self.mgr.a_speed_kmh, 1),
-            "tracker_speed_kmh": None if self.mgr.b_speed_kmh is None else round(self.mgr.b_speed_kmh, 1),
-            "base_last_update": self.mgr.a_last_fix.isoformat() if self.mgr.a_last_fix else None,
-            "tracker_last_update": self.mgr.b_last_fix.isoformat() if self.mgr.b_last_fix else None,
-            "base_updates_recent": self.mgr.data.a_updates_in_window,
-            "tracker_updates_recent": self.mgr.data.b_updates_in_window,
+            "base_speed_kmh": speed_a,
+            "tracker_speed_kmh": speed_b,
+            "base_last_update": a_fix,
+            "tracker_last_update": b_fix,
+            "base_updates_recent": data.a_updates_in_window,
+            "tracker_updates_recent": data.b_updates_in_window,
 
             # Legacy aliases (for backward compatibility)
-            "entity_a": self.mgr.base_entity,
-            "entity_b": self.mgr.tracker_entity,
-            "speed_a_kmh": None if self.mgr.a_speed_kmh is None else round(self.mgr.a_speed_kmh, 1),
-            "speed_b_kmh": None if self.mgr.b_speed_kmh is None else round(self.mgr.b_speed_kmh, 1),
-            "a_last_fix": self.mgr.a_last_fix.isoformat() if self.mgr.a_last_fix else None,
-            "b_last_fix": self.mgr.b_last_fix.isoformat() if self.mgr.b_last_fix else None,
-            "a_resync_until": self.mgr.a_resync_until.isoformat() if self.mgr.a_resync_until else None,
-            "b_resync_until": self.mgr.b_resync_until.isoformat() if self.mgr.b_resync_until else None,
-            "a_updates_in_window": self.mgr.data.a_updates_in_window,
-            "b_updates_in_window": self.mgr.data.b_updates_in_window,
-
-            # Configuration
-            "entry_threshold_m": self.mgr.entry_th,
-            "exit_threshold_m": self.mgr.exit_th,
-            "debounce_seconds": self.mgr.debounce_s,
-            "max_accuracy_m": self.mgr.max_acc_m,
-            "force_meters": self.mgr.force_meters,
-            # movement/resync configuration
-            "resync_silence_s": self.mgr.resync_silence_s,
-            "resync_hold_s": self.mgr.resync_hold_s,
-            "max_speed_kmh": self.mgr.max_speed_kmh,
-            # reliability configuration
-            "min_updates_for_proximity": self.mgr.min_updates_for_proximity,
-            "update_window_s": self.mgr.update_window_s,
-            "require_reliable_proximity": self.mgr.require_reliable_proximity,
+            "speed_a_kmh": speed_a,
+            "speed_b_kmh": speed_b,
+            "a_last_fix": a_fix,
+            "b_last_fix": b_fix,
+            "a_resync_until": mgr.a_resync_until_iso,
+            "b_resync_until": mgr.b_resync_until_iso,
+            "a_updates_in_window": data.a_updates_in_window,
+            "b_updates_in_window": data.b_updates_in_window,
 
             # State
-            "data_valid": self.mgr.data.data_valid,
-            "last_valid_updated": self.mgr.data.last_valid_updated,
-            "last_error": self.mgr.data.last_error,
-            "proximity_update_count": self.mgr.data.proximity_update_count,
-            "proximity_duration_min": self.mgr.proximity_duration_minutes(),
-            "proximity_duration_human": self.mgr.proximity_duration_human(),
-            "last_changed": self.mgr.data.last_changed,
-            "last_entered": self.mgr.data.last_entered,
-            "last_left": self.mgr.data.last_left,
+            "data_valid": data.data_valid,
+            "last_valid_updated": data.last_valid_updated,
+            "last_error": data.last_error,
+            "proximity_update_count": data.proximity_update_count,
+            "proximity_duration_min": mgr.proximity_duration_minutes(),
+            "proximity_duration_human": mgr.proximity_duration_human(),
+            "last_changed": data.last_changed,
+            "last_entered": data.last_entered,
+            "last_left": data.last_left,
             # reliability state attributes
-            "proximity_reliable": self.mgr.data.proximity_reliable,
-            "unreliable_reason": self.mgr.data.unreliable_reason,
-            "convergence_speed_kmh": None if self.mgr.data.convergence_speed_kmh is None else round(self.mgr.data.convergence_speed_kmh, 1),
+            "proximity_reliable": data.proximity_reliable,
+            "unreliable_reason": data.unreliable_reason,
+            "convergence_speed_kmh": None if data.convergence_speed_kmh is None else round(data.convergence_speed_kmh, 1),
         }
\ No newline at end of file
@@ -21,16 +21,18 @@ async def async_setup_entry(hass, entry, async_add_entities) -> None:
     """Set up the Member Adjacency refresh button based on a config entry."""
     mgr: AdjacencyManager = hass.data[DOMAIN][entry.entry_id]
 
-    # Ensure the entity exists in the entity registry for discovery
+    # Ensure the entity exists in the entity registry for discovery; the
+    # lookup skips the create path on every reload after the first
     ent_reg = er.async_get(hass)
-    pair_key = mgr.pair_key
-    ent_reg.async_get_or_create(
-        "button",
-        DOMAIN,
-        f"{entry.entry_id}_refresh",
-        suggested_object_id=f"member_adjacency_{pair_key}_refresh",
-        config_entry=entry,
-    )
+    unique_id = f"{entry.entry_id}_refresh"
+    if ent_reg.async_get_entity_id("button", DOMAIN, unique_id) is None:
+        ent_reg.async_get_or_create(
+            "button",
+            DOMAIN,
+            unique_id,
+            suggested_object_id=f"member_adjacency_{mgr.pair_key}_refresh",
+            config_entry=entry,
+        )
 
     async_add_entities([MemberAdjacencyRefreshButton(mgr)])
 
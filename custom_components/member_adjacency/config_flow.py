@@ -37,6 +37,7 @@ from .const import (
     CONF_MIN_UPDATES_FOR_PROXIMITY,
     CONF_UPDATE_WINDOW_S,
     CONF_REQUIRE_RELIABLE_PROXIMITY,
+    CONF_NOISE_FLOOR_M,
     DEFAULT_ENTRY_THRESHOLD_M,
     DEFAULT_EXIT_THRESHOLD_M,
     DEFAULT_DEBOUNCE_SECONDS,
@@ -48,6 +49,7 @@ from .const import (
     DEFAULT_MIN_UPDATES_FOR_PROXIMITY,
     DEFAULT_UPDATE_WINDOW_S,
     DEFAULT_REQUIRE_RELIABLE_PROXIMITY,
+    DEFAULT_NOISE_FLOOR_M,
     DOMAIN,
     GEO_SUFFIX,
 )
@@ -243,6 +245,7 @@ class MemberAdjacencyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_MIN_UPDATES_FOR_PROXIMITY: advanced.get(CONF_MIN_UPDATES_FOR_PROXIMITY, DEFAULT_MIN_UPDATES_FOR_PROXIMITY),
                     CONF_UPDATE_WINDOW_S: advanced.get(CONF_UPDATE_WINDOW_S, DEFAULT_UPDATE_WINDOW_S),
                     CONF_REQUIRE_RELIABLE_PROXIMITY: advanced.get(CONF_REQUIRE_RELIABLE_PROXIMITY, DEFAULT_REQUIRE_RELIABLE_PROXIMITY),
+                    CONF_NOISE_FLOOR_M: advanced.get(CONF_NOISE_FLOOR_M, DEFAULT_NOISE_FLOOR_M),
                 }
 
                 return self.async_create_entry(title=title, data=data_to_store)
@@ -275,6 +278,9 @@ class MemberAdjacencyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 selector.NumberSelectorConfig(min=60, max=1800, step=30, unit_of_measurement="s", mode=selector.NumberSelectorMode.BOX)
             ),
             vol.Required(CONF_REQUIRE_RELIABLE_PROXIMITY, default=DEFAULT_REQUIRE_RELIABLE_PROXIMITY): selector.BooleanSelector(),
+            vol.Required(CONF_NOISE_FLOOR_M, default=DEFAULT_NOISE_FLOOR_M): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=0, max=100, step=0.5, unit_of_measurement="m", mode=selector.NumberSelectorMode.BOX)
+            ),
         })
 
         # Main schema with basic settings and collapsible advanced section
@@ -344,6 +350,7 @@ class MemberAdjacencyOptionsFlow(config_entries.OptionsFlow):
                     CONF_MIN_UPDATES_FOR_PROXIMITY: advanced.get(CONF_MIN_UPDATES_FOR_PROXIMITY, DEFAULT_MIN_UPDATES_FOR_PROXIMITY),
                     CONF_UPDATE_WINDOW_S: advanced.get(CONF_UPDATE_WINDOW_S, DEFAULT_UPDATE_WINDOW_S),
                     CONF_REQUIRE_RELIABLE_PROXIMITY: advanced.get(CONF_REQUIRE_RELIABLE_PROXIMITY, DEFAULT_REQUIRE_RELIABLE_PROXIMITY),
+                    CONF_NOISE_FLOOR_M: advanced.get(CONF_NOISE_FLOOR_M, DEFAULT_NOISE_FLOOR_M),
                 }
                 return self.async_create_entry(title="", data=flat_data)
 
@@ -365,6 +372,9 @@ class MemberAdjacencyOptionsFlow(config_entries.OptionsFlow):
                 selector.NumberSelectorConfig(min=60, max=1800, step=30, unit_of_measurement="s", mode=selector.NumberSelectorMode.BOX)
             ),
             vol.Required(CONF_REQUIRE_RELIABLE_PROXIMITY, default=data.get(CONF_REQUIRE_RELIABLE_PROXIMITY, DEFAULT_REQUIRE_RELIABLE_PROXIMITY)): selector.BooleanSelector(),
+            vol.Required(CONF_NOISE_FLOOR_M, default=data.get(CONF_NOISE_FLOOR_M, DEFAULT_NOISE_FLOOR_M)): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=0, max=100, step=0.5, unit_of_measurement="m", mode=selector.NumberSelectorMode.BOX)
+            ),
         })
 
         # Main options schema
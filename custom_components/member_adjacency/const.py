@@ -35,6 +35,7 @@ CONF_MAX_SPEED_KMH = "max_speed_kmh"        # max reasonable speed before filter
 CONF_MIN_UPDATES_FOR_PROXIMITY = "min_updates_for_proximity"  # min updates in window for valid proximity
 CONF_UPDATE_WINDOW_S = "update_window_s"    # window for counting recent updates
 CONF_REQUIRE_RELIABLE_PROXIMITY = "require_reliable_proximity"  # require reliable data for enter event
+CONF_NOISE_FLOOR_M = "noise_floor_m"        # suppress updates when distance moved less than this
 
 # Defaults
 DEFAULT_NAME_KO = "인접센서"
@@ -52,6 +53,7 @@ DEFAULT_MAX_SPEED_KMH = 150    # any speed over 150 km/h is considered invalid
 DEFAULT_MIN_UPDATES_FOR_PROXIMITY = 3  # both sides need at least 3 updates in window (conservative)
 DEFAULT_UPDATE_WINDOW_S = 300    # 5 minute window for counting updates
 DEFAULT_REQUIRE_RELIABLE_PROXIMITY = True  # safe default: only fire enter event if reliable
+DEFAULT_NOISE_FLOOR_M = 1.0  # sub-meter jitter is GPS noise; 0 disables the filter
 
 # Suffix for geocoded sensors
 GEO_SUFFIX = "_geocoded_location"
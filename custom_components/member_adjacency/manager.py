@@ -21,19 +21,19 @@ proximity notifications when GPS coordinates jump or arrive out of order.
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+import math
+from bisect import bisect_right
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ServiceNotFound
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
-from homeassistant.util.location import distance as ha_distance  # HA Core distance (meters)
 
 from .const import (
     BUCKETS,
@@ -46,6 +46,7 @@ from .const import (
     CONF_EXIT_THRESHOLD_M,
     CONF_FORCE_METERS,
     CONF_MAX_ACCURACY_M,
+    CONF_NOISE_FLOOR_M,
     CONF_RESYNC_SILENCE_S,
     CONF_RESYNC_HOLD_S,
     CONF_MAX_SPEED_KMH,
@@ -57,6 +58,7 @@ from .const import (
     DEFAULT_EXIT_THRESHOLD_M,
     DEFAULT_FORCE_METERS,
     DEFAULT_MAX_ACCURACY_M,
+    DEFAULT_NOISE_FLOOR_M,
     DEFAULT_RESYNC_SILENCE_S,
     DEFAULT_RESYNC_HOLD_S,
     DEFAULT_MAX_SPEED_KMH,
@@ -72,7 +74,7 @@ from .const import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class AdjacencyData:
     """Structure holding the latest computed data for an adjacency."""
 
@@ -118,16 +120,82 @@ def _short(entity_id: str) -> str:
     return _obj_id(entity_id).replace("_geocoded_location", "")
 
 
-def _round1(x: float) -> float:
-    return round(float(x), 1)
-
-
-def _try_get_coords_from_state(state) -> tuple[float, float] | None:
-    """Extract latitude/longitude from a state object."""
-    if state is None:
-        return None
-
-    attrs = state.attributes or {}
+def _round1(x: float, _r=round) -> float:
+    # values reaching here are already floats; skip the float() coercion and
+    # resolve round once at definition time
+    return _r(x, 1)
+
+
+_EARTH_RADIUS_M = 6371008.8
+_DEG_TO_RAD = math.pi / 180.0
+
+# Per-coordinate trig cache for the haversine fallback.  Only one endpoint
+# usually moves per refresh, so the stationary side's radians/cosine are
+# reused.  Bounded to a handful of entries — two per active pair suffices.
+_TRIG_CACHE: dict[tuple[float, float], tuple[float, float, float]] = {}
+_TRIG_CACHE_MAX = 8
+
+
+def _trig(lat: float, lon: float) -> tuple[float, float, float]:
+    """Return ``(lat_rad, cos(lat), lon_rad)`` for a coordinate, cached."""
+    key = (lat, lon)
+    hit = _TRIG_CACHE.get(key)
+    if hit is None:
+        lat_r = lat * _DEG_TO_RAD
+        hit = (lat_r, math.cos(lat_r), lon * _DEG_TO_RAD)
+        if len(_TRIG_CACHE) >= _TRIG_CACHE_MAX:
+            _TRIG_CACHE.pop(next(iter(_TRIG_CACHE)))
+        _TRIG_CACHE[key] = hit
+    return hit
+
+
+def _haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in meters (full haversine, cached trig)."""
+    lat1_r, cos1, lon1_r = _trig(lat1, lon1)
+    lat2_r, cos2, lon2_r = _trig(lat2, lon2)
+    sin_dlat = math.sin((lat2_r - lat1_r) * 0.5)
+    sin_dlon = math.sin((lon2_r - lon1_r) * 0.5)
+    a = sin_dlat * sin_dlat + cos1 * cos2 * sin_dlon * sin_dlon
+    return 2.0 * _EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def _fast_distance_m(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float,
+    _cos=math.cos,
+    _hypot=math.hypot,
+) -> float:
+    """Distance in meters between two nearby coordinates.
+
+    At the ranges relevant to proximity detection an equirectangular
+    projection (one ``cos`` plus one ``hypot``) is accurate to well under
+    0.5%, versus the four trig calls of a full haversine.  Separations above
+    half a degree of latitude fall back to the haversine.  The math functions
+    are bound as defaults to skip the module-attribute lookups per call.
+    """
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    if abs(dlat) > 0.5 or abs(dlon) > 0.5:
+        return _haversine_m(lat1, lon1, lat2, lon2)
+    mid_cos = _cos((lat1 + lat2) * 0.5 * _DEG_TO_RAD)
+    dx = dlon * _DEG_TO_RAD * mid_cos * _EARTH_RADIUS_M
+    dy = dlat * _DEG_TO_RAD * _EARTH_RADIUS_M
+    return _hypot(dx, dy)
+
+
+def _coords_from_attrs(attrs, state_str) -> tuple[float, float] | None:
+    """Extract latitude/longitude from a state's attributes dict and state string."""
+    # general entities (device_tracker/person/zone) — by far the common case,
+    # so probe it first with two plain gets
+    lat = attrs.get("latitude")
+    lon = attrs.get("longitude")
+    if lat is not None and lon is not None:
+        try:
+            return (float(lat), float(lon))
+        except (TypeError, ValueError):
+            return None
 
     # mobile_app geocoded sensor
     loc = attrs.get("Location")
@@ -137,32 +205,30 @@ def _try_get_coords_from_state(state) -> tuple[float, float] | None:
         except (TypeError, ValueError):
             return None
 
-    # general entities
-    if "latitude" in attrs and "longitude" in attrs:
-        try:
-            return (float(attrs["latitude"]), float(attrs["longitude"]))
-        except (TypeError, ValueError):
-            return None
-
-    # string state "lat,lon"
-    if isinstance(state.state, str) and "," in state.state:
-        parts = [p.strip() for p in state.state.split(",")]
-        if len(parts) == 2:
+    # string state "lat,lon" — partition avoids the list allocation that
+    # split() pays on the (dominant) no-comma failure path
+    if isinstance(state_str, str):
+        head, sep, tail = state_str.partition(",")
+        if sep and "," not in tail:
             try:
-                return (float(parts[0]), float(parts[1]))
+                return (float(head), float(tail))
             except (TypeError, ValueError):
                 return None
 
     return None
 
 
-def _get_accuracy_m(state) -> float | None:
-    """Extract a GPS accuracy value from a state object's attributes."""
-    if state is None:
-        return None
-    attrs = state.attributes or {}
-    for k in ("gps_accuracy", "accuracy", "horizontal_accuracy"):
-        v = attrs.get(k)
+def _acc_from_attrs(attrs) -> float | None:
+    """Extract a GPS accuracy value from a state's attributes dict."""
+    # device_tracker / mobile_app report numeric gps_accuracy; take that
+    # branch without the try/except machinery
+    v = attrs.get("gps_accuracy")
+    if type(v) in (int, float):
+        return float(v)
+    # per-key fallback: an unparseable leading value (e.g. "unknown") must
+    # not shadow a usable key further down, and a literal 0 stays 0.0
+    for key in ("gps_accuracy", "accuracy", "horizontal_accuracy"):
+        v = attrs.get(key)
         if v is None:
             continue
         try:
@@ -172,24 +238,44 @@ def _get_accuracy_m(state) -> float | None:
     return None
 
 
+def _try_get_coords_from_state(state) -> tuple[float, float] | None:
+    """Extract latitude/longitude from a state object."""
+    if state is None:
+        return None
+    attrs = state.attributes
+    # an empty attributes dict can skip the attribute probes, but the state
+    # string itself may still carry "lat,lon" — let the parser see it
+    return _coords_from_attrs(attrs, state.state)
+
+
+def _get_accuracy_m(state) -> float | None:
+    """Extract a GPS accuracy value from a state object's attributes."""
+    if state is None:
+        return None
+    # State.attributes is always a dict (possibly empty), never None
+    return _acc_from_attrs(state.attributes)
+
+
+# Parallel arrays for bisect: bucket i applies while distance < limit i
+_BUCKET_LIMITS = [limit for limit, _ in BUCKETS]
+_BUCKET_NAMES = [name for _, name in BUCKETS]
+
+
 def _bucket(distance_m: float) -> str:
     """Map a raw distance in meters to a named bucket."""
-    for limit, name in BUCKETS:
-        if distance_m < limit:
-            return name
-    return BUCKETS[-1][1]
+    idx = bisect_right(_BUCKET_LIMITS, distance_m)
+    if idx >= len(_BUCKET_NAMES):
+        idx = len(_BUCKET_NAMES) - 1
+    return _BUCKET_NAMES[idx]
+
+
+# Characters mobile_app replaces with underscores in its service names
+_SERVICE_SANITIZE = str.maketrans({"-": "_", " ": "_", ".": "_", ":": "_"})
 
 
 def _sanitize_service_suffix(s: str) -> str:
     """Sanitize a service name suffix for the mobile_app integration."""
-    return (
-        s.strip()
-        .lower()
-        .replace("-", "_")
-        .replace(" ", "_")
-        .replace(".", "_")
-        .replace(":", "_")
-    )
+    return s.strip().lower().translate(_SERVICE_SANITIZE)
 
 
 def _format_duration_ko(total_seconds: int) -> str:
@@ -218,6 +304,71 @@ def _format_duration_ko(total_seconds: int) -> str:
 class AdjacencyManager:
     """Compute adjacency once and share across entities (sensor/binary_sensor/button)."""
 
+    __slots__ = (
+        "hass",
+        "entry",
+        "base_entity",
+        "tracker_entity",
+        "entity_a",
+        "entity_b",
+        # options (re-read in _refresh_options)
+        "entry_th",
+        "exit_th",
+        "debounce_s",
+        "max_acc_m",
+        "force_meters",
+        "resync_silence_s",
+        "resync_hold_s",
+        "max_speed_kmh",
+        "min_updates_for_proximity",
+        "update_window_s",
+        "require_reliable_proximity",
+        "noise_floor_m",
+        "_entry_th_f",
+        "_exit_th_f",
+        "_max_acc_m_f",
+        "_payload_base",
+        "_payload_thresholds",
+        "static_attrs",
+        "_pair_key",
+        "_signal",
+        # runtime state
+        "data",
+        "version",
+        "attrs_cache",
+        "_listeners",
+        "_unsub",
+        "_unsub_registry",
+        "_cancel_debounce",
+        "_proximity_since",
+        "_duration_min",
+        "_duration_human",
+        "_mobile_service_cache",
+        "_dev_name_cache",
+        "_device_info",
+        "a_prev_coords",
+        "b_prev_coords",
+        "a_last_fix",
+        "b_last_fix",
+        "a_last_fix_iso",
+        "b_last_fix_iso",
+        "a_speed_kmh",
+        "b_speed_kmh",
+        "a_resync_until",
+        "b_resync_until",
+        "a_resync_until_iso",
+        "b_resync_until_iso",
+        "a_update_history",
+        "b_update_history",
+        "_prev_distance_m",
+        "_prev_distance_time",
+        "_last_inputs",
+        "_last_notified",
+        "_dist_cache",
+        "_state_cache",
+        "_window_until",
+    )
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         self.hass = hass
         self.entry = entry
@@ -230,29 +381,55 @@ class AdjacencyManager:
         self.entity_a = self.base_entity
         self.entity_b = self.tracker_entity
 
-        # Hysteresis thresholds, debounce and accuracy filtering
-        self.entry_th: int = int(_get(entry, CONF_ENTRY_THRESHOLD_M, DEFAULT_ENTRY_THRESHOLD_M))
-        self.exit_th: int = int(_get(entry, CONF_EXIT_THRESHOLD_M, DEFAULT_EXIT_THRESHOLD_M))
-        self.debounce_s: int = int(_get(entry, CONF_DEBOUNCE_SECONDS, DEFAULT_DEBOUNCE_SECONDS))
-        self.max_acc_m: int = int(_get(entry, CONF_MAX_ACCURACY_M, DEFAULT_MAX_ACCURACY_M))
-        self.force_meters: bool = bool(_get(entry, CONF_FORCE_METERS, DEFAULT_FORCE_METERS))
+        # Both strings are derived from immutable entry fields; compute once
+        # instead of re-formatting on every property access.
+        a_id = _short(self.entity_a) if self.entity_a else "a"
+        b_id = _short(self.entity_b) if self.entity_b else "b"
+        self._pair_key: str = f"{a_id}_{b_id}"
+        self._signal: str = f"{SIGNAL_UPDATE_PREFIX}_{entry.entry_id}"
 
-        # New options for movement filtering
-        self.resync_silence_s: int = int(_get(entry, CONF_RESYNC_SILENCE_S, DEFAULT_RESYNC_SILENCE_S))
-        self.resync_hold_s: int = int(_get(entry, CONF_RESYNC_HOLD_S, DEFAULT_RESYNC_HOLD_S))
-        self.max_speed_kmh: float = float(_get(entry, CONF_MAX_SPEED_KMH, DEFAULT_MAX_SPEED_KMH))
-        self.min_updates_for_proximity: int = int(_get(entry, CONF_MIN_UPDATES_FOR_PROXIMITY, DEFAULT_MIN_UPDATES_FOR_PROXIMITY))
-        self.update_window_s: int = int(_get(entry, CONF_UPDATE_WINDOW_S, DEFAULT_UPDATE_WINDOW_S))
-        self.require_reliable_proximity: bool = bool(_get(entry, CONF_REQUIRE_RELIABLE_PROXIMITY, DEFAULT_REQUIRE_RELIABLE_PROXIMITY))
+        # Hysteresis thresholds, debounce, accuracy and movement filtering
+        self._refresh_options()
 
         # Data container shared with entities
         self.data = AdjacencyData()
 
+        # Monotonic counter bumped whenever self.data is swapped; entity
+        # platforms key attribute caches on it.
+        self.version: int = 0
+
+        # (version, attrs dict) built lazily by the first sensor to render
+        # after a data swap and shared by the rest
+        self.attrs_cache: tuple[int, dict[str, Any]] | None = None
+
+        # Entities notified on update; held directly instead of going through
+        # the dispatcher (signal hashing + wrapped callbacks) for what is a
+        # strictly manager-internal fan-out.
+        self._listeners: list[CALLBACK_TYPE] = []
+
         # Unsubscription callbacks
         self._unsub = None
+        self._unsub_registry: list = []
         self._cancel_debounce = None
         self._proximity_since: datetime | None = None
 
+        # Proximity-duration renderings for the current tick; refreshed once
+        # per refresh instead of per consuming entity
+        self._duration_min: float = 0.0
+        self._duration_human: str = _format_duration_ko(0)
+
+        # entity_id -> mobile_app notify service name (None = not a mobile_app
+        # device).  The mapping only changes on registry updates, which clear it.
+        self._mobile_service_cache: dict[str, str | None] = {}
+
+        # entity_id -> resolved device/friendly name.  device_info()/the entity
+        # names hit this on every attribute render; resolving walks the entity
+        # and device registries, so do it once per registry generation.
+        self._dev_name_cache: dict[str, str] = {}
+
+        # Lazily built device_info dict; invalidated with the name cache
+        self._device_info: dict[str, Any] | None = None
+
         # Per side movement tracking
         self.a_prev_coords: tuple[float, float] | None = None
         self.b_prev_coords: tuple[float, float] | None = None
@@ -263,6 +440,13 @@ class AdjacencyManager:
         self.a_resync_until: datetime | None = None
         self.b_resync_until: datetime | None = None
 
+        # ISO renderings of the four timestamps above, refreshed alongside
+        # them so the platforms never re-serialize per attribute build
+        self.a_last_fix_iso: str | None = None
+        self.b_last_fix_iso: str | None = None
+        self.a_resync_until_iso: str | None = None
+        self.b_resync_until_iso: str | None = None
+
         # 업데이트 이력 추적 (최근 업데이트 타임스탬프 리스트)
         self.a_update_history: list[datetime] = []
         self.b_update_history: list[datetime] = []
@@ -271,33 +455,128 @@ class AdjacencyManager:
         self._prev_distance_m: float | None = None
         self._prev_distance_time: datetime | None = None
 
+        # Fingerprint of the inputs of the last successful refresh; re-reported
+        # states with identical coords/accuracy are dropped without recomputing.
+        self._last_inputs: tuple | None = None
+
+        # Snapshot of what subscribed entities last rendered; dispatches that
+        # would repaint the exact same state are suppressed.
+        self._last_notified: tuple | None = None
+
+        # Size-1 cache of the last computed distance keyed by both coordinate
+        # pairs.  Catches refreshes where only accuracy changed (same fixes),
+        # which slip past the full-input fingerprint.
+        self._dist_cache: tuple[tuple, float] | None = None
+
+        # Last seen State per tracked entity, fed from the change events so
+        # refreshes skip the hass.states machine lookups.
+        self._state_cache: dict[str, Any] = {}
+
+        # Leading-edge debounce window (loop.time() deadline).  The first
+        # request in a quiet period refreshes immediately; only requests
+        # arriving inside the window wait out the trailing timer.
+        self._window_until: float = 0.0
+
+
+    def _refresh_options(self) -> None:
+        """Read all configurable values from the entry (options first, then data).
+
+        Thresholds used in per-refresh comparisons are additionally stored
+        pre-coerced to ``float`` so the hot path never re-casts them.
+        """
+        entry = self.entry
+
+        # Hysteresis thresholds, debounce and accuracy filtering
+        self.entry_th: int = int(_get(entry, CONF_ENTRY_THRESHOLD_M, DEFAULT_ENTRY_THRESHOLD_M))
+        self.exit_th: int = int(_get(entry, CONF_EXIT_THRESHOLD_M, DEFAULT_EXIT_THRESHOLD_M))
+        self.debounce_s: int = int(_get(entry, CONF_DEBOUNCE_SECONDS, DEFAULT_DEBOUNCE_SECONDS))
+        self.max_acc_m: int = int(_get(entry, CONF_MAX_ACCURACY_M, DEFAULT_MAX_ACCURACY_M))
+        self.force_meters: bool = bool(_get(entry, CONF_FORCE_METERS, DEFAULT_FORCE_METERS))
+
+        # Movement filtering and resync handling
+        self.resync_silence_s: int = int(_get(entry, CONF_RESYNC_SILENCE_S, DEFAULT_RESYNC_SILENCE_S))
+        self.resync_hold_s: int = int(_get(entry, CONF_RESYNC_HOLD_S, DEFAULT_RESYNC_HOLD_S))
+        self.max_speed_kmh: float = float(_get(entry, CONF_MAX_SPEED_KMH, DEFAULT_MAX_SPEED_KMH))
+        self.min_updates_for_proximity: int = int(_get(entry, CONF_MIN_UPDATES_FOR_PROXIMITY, DEFAULT_MIN_UPDATES_FOR_PROXIMITY))
+        self.update_window_s: int = int(_get(entry, CONF_UPDATE_WINDOW_S, DEFAULT_UPDATE_WINDOW_S))
+        self.require_reliable_proximity: bool = bool(_get(entry, CONF_REQUIRE_RELIABLE_PROXIMITY, DEFAULT_REQUIRE_RELIABLE_PROXIMITY))
+        self.noise_floor_m: float = float(_get(entry, CONF_NOISE_FLOOR_M, DEFAULT_NOISE_FLOOR_M))
+
+        # Pre-coerced floats used by the per-refresh comparisons
+        self._entry_th_f: float = float(self.entry_th)
+        self._exit_th_f: float = float(self.exit_th)
+        self._max_acc_m_f: float = float(self.max_acc_m)
+
+        # Static part of every bus-event payload; entity ids never change and
+        # the thresholds only change here, so build the template once.
+        self._payload_base: dict[str, Any] = {
+            # New semantic naming (v1.4+)
+            "base_entity": self.base_entity,
+            "tracker_entity": self.tracker_entity,
+            # Legacy keys (backward compatibility)
+            "entity_a": self.entity_a,
+            "entity_b": self.entity_b,
+        }
+        self._payload_thresholds: dict[str, Any] = {
+            **self._payload_base,
+            "entry_threshold_m": self.entry_th,
+            "exit_threshold_m": self.exit_th,
+        }
+
+        # Static block of the entity attribute dicts (entity ids plus
+        # configuration); only changes when the options change, so platforms
+        # copy it instead of re-reading every field per state write.
+        self.static_attrs: dict[str, Any] = {
+            **self._payload_base,
+            "entry_threshold_m": self.entry_th,
+            "exit_threshold_m": self.exit_th,
+            "debounce_seconds": self.debounce_s,
+            "max_accuracy_m": self.max_acc_m,
+            "force_meters": self.force_meters,
+            # movement/resync configuration
+            "resync_silence_s": self.resync_silence_s,
+            "resync_hold_s": self.resync_hold_s,
+            "max_speed_kmh": self.max_speed_kmh,
+            # reliability configuration
+            "min_updates_for_proximity": self.min_updates_for_proximity,
+            "update_window_s": self.update_window_s,
+            "require_reliable_proximity": self.require_reliable_proximity,
+            "noise_floor_m": self.noise_floor_m,
+        }
+
     @property
     def pair_key(self) -> str:
-        a_id = _short(self.entity_a) if self.entity_a else "a"
-        b_id = _short(self.entity_b) if self.entity_b else "b"
-        return f"{a_id}_{b_id}"
+        return self._pair_key
 
     @property
     def signal(self) -> str:
-        return f"{SIGNAL_UPDATE_PREFIX}_{self.entry.entry_id}"
+        return self._signal
 
     # --- device naming ---
     def _fallback_name(self, entity_id: str) -> str:
         st = self.hass.states.get(entity_id)
-        if st and (st.attributes or {}).get("friendly_name"):
+        if st and st.attributes.get("friendly_name"):
             return str(st.attributes["friendly_name"])
         return _short(entity_id) if entity_id else entity_id
 
     def _resolve_device_name(self, entity_id: str) -> str:
+        cached = self._dev_name_cache.get(entity_id)
+        if cached is not None:
+            return cached
+
         ent_reg = er.async_get(self.hass)
         dev_reg = dr.async_get(self.hass)
 
         ent = ent_reg.async_get(entity_id)
+        name = None
         if ent and ent.device_id:
             dev = dev_reg.async_get(ent.device_id)
             if dev:
-                return dev.name_by_user or dev.name or self._fallback_name(entity_id)
-        return self._fallback_name(entity_id)
+                name = dev.name_by_user or dev.name
+        if not name:
+            name = self._fallback_name(entity_id)
+        self._dev_name_cache[entity_id] = name
+        return name
 
     def get_base_name(self) -> str:
         """Get friendly name for base entity (기준점)."""
@@ -311,12 +590,14 @@ class AdjacencyManager:
         return f"{self.get_tracker_name()} → {self.get_base_name()}"
 
     def device_info(self) -> dict[str, Any]:
-        return {
-            "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.device_name(),
-            "manufacturer": "1bobby-git",
-            "model": "Member Adjacency Distance",
-        }
+        if self._device_info is None:
+            self._device_info = {
+                "identifiers": {(DOMAIN, self.entry.entry_id)},
+                "name": self.device_name(),
+                "manufacturer": "1bobby-git",
+                "model": "Member Adjacency Distance",
+            }
+        return self._device_info
 
     # --- proximity duration ---
     def proximity_duration_seconds(self) -> int:
@@ -326,27 +607,142 @@ class AdjacencyManager:
         return max(0, int(delta.total_seconds()))
 
     def proximity_duration_minutes(self) -> float:
-        return _round1(self.proximity_duration_seconds() / 60.0)
+        return self._duration_min
 
     def proximity_duration_human(self) -> str:
-        return _format_duration_ko(self.proximity_duration_seconds())
+        return self._duration_human
+
+    def _update_duration(self, now: datetime) -> None:
+        """Cache the duration renderings all entities share this tick."""
+        if not self.data.proximity or self._proximity_since is None:
+            secs = 0
+        else:
+            secs = max(0, int((now - self._proximity_since).total_seconds()))
+        duration_min = _round1(secs / 60.0)
+        if duration_min != self._duration_min:
+            # duration feeds entity state/attrs; invalidate the shared attrs
+            # cache so the next render picks up the new value
+            self._duration_min = duration_min
+            self._duration_human = _format_duration_ko(secs)
+            self.version += 1
+
+    def _swap_invalid(self, acc_a: float | None, acc_b: float | None, error: str) -> None:
+        """Swap in an invalid-data snapshot (keeps last good values) and notify."""
+        self.data = replace(
+            self.data,
+            accuracy_a=acc_a,
+            accuracy_b=acc_b,
+            data_valid=False,
+            last_error=error,
+        )
+        self.version += 1
+        self._async_notify()
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Subscribe an entity update callback; returns the remove function."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(update_callback)
+
+        return _remove
+
+    @callback
+    def _async_notify(self) -> None:
+        """Wake subscribed entities, skipping no-op repaints.
+
+        Comparing the fields that drive entity state/display means a refresh
+        that ends in an unchanged snapshot (same rounded distance, proximity,
+        bucket, validity, error and duration) does not fan out to every
+        platform.
+        """
+        d = self.data
+        snapshot = (
+            None if d.distance_m is None else round(d.distance_m, 1),
+            d.proximity,
+            d.bucket,
+            d.data_valid,
+            d.last_error,
+            d.proximity_update_count,
+            # material accuracy changes must repaint even with frozen coords
+            None if d.accuracy_a is None else round(d.accuracy_a, 1),
+            None if d.accuracy_b is None else round(d.accuracy_b, 1),
+            # keeps the duration sensor ticking while everything else is static
+            self._duration_min,
+        )
+        if snapshot == self._last_notified:
+            return
+        self._last_notified = snapshot
+        for update_callback in self._listeners:
+            update_callback()
 
     # --- lifecycle ---
     async def async_start(self) -> None:
         await self.async_refresh()
 
         @callback
-        def _handle(_event) -> None:
+        def _handle(event) -> None:
+            # Ignore events that carry no new position: friendly_name/icon
+            # churn and re-reported states would otherwise schedule a debounce
+            # timer and a full refresh for nothing.
+            new = event.data.get("new_state")
+            if new is None:
+                # entity removed/renamed: refresh so the pair surfaces
+                # missing_coords instead of publishing the last distance
+                self._state_cache.pop(event.data.get("entity_id"), None)
+                self.request_refresh()
+                return
+            # the event already carries the state; remember it so the refresh
+            # doesn't go back through hass.states
+            self._state_cache[event.data["entity_id"]] = new
+            old = event.data.get("old_state")
+            if (
+                old is not None
+                and _try_get_coords_from_state(old) == _try_get_coords_from_state(new)
+                and _get_accuracy_m(old) == _get_accuracy_m(new)
+            ):
+                return
             self.request_refresh()
 
         self._unsub = async_track_state_change_event(
             self.hass, [self.entity_a, self.entity_b], _handle
         )
 
+        @callback
+        def _registry_changed(_event) -> None:
+            self._mobile_service_cache.clear()
+            self._dev_name_cache.clear()
+            self._device_info = None
+
+        self._unsub_registry = [
+            self.hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _registry_changed),
+            self.hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, _registry_changed),
+        ]
+
+        self.entry.async_on_unload(self.entry.add_update_listener(self._async_options_updated))
+
+    async def _async_options_updated(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Re-read cached option values when the config entry is updated."""
+        self._refresh_options()
+        # options feed the static attribute block; invalidate platform caches
+        # even if the refresh below short-circuits
+        self.version += 1
+        # options outside the inputs fingerprint (force_meters, noise floor,
+        # debounce…) must still repaint: drop the fingerprint and the notify
+        # snapshot so the refresh runs fully and the fan-out is not suppressed
+        self._last_inputs = None
+        self._last_notified = None
+        await self.async_refresh()
+
     async def async_stop(self) -> None:
         if self._unsub:
             self._unsub()
             self._unsub = None
+        for unsub in self._unsub_registry:
+            unsub()
+        self._unsub_registry = []
         if self._cancel_debounce:
             self._cancel_debounce()
             self._cancel_debounce = None
@@ -357,15 +753,25 @@ class AdjacencyManager:
             self._cancel_debounce = None
 
         if self.debounce_s <= 0:
-            self.hass.async_create_task(self.async_refresh())
+            self._refresh()
+            return
+
+        # Leading edge: a lone update after a quiet period refreshes without
+        # the debounce delay, and arms the window that coalesces any burst
+        # that follows.
+        now = self.hass.loop.time()
+        if now >= self._window_until:
+            self._window_until = now + self.debounce_s
+            self._refresh()
             return
 
         @callback
         def _later(_now) -> None:
             self._cancel_debounce = None
-            self.hass.async_create_task(self.async_refresh())
+            self._window_until = self.hass.loop.time() + self.debounce_s
+            self._refresh()
 
-        self._cancel_debounce = async_call_later(self.hass, self.debounce_s, _later)
+        self._cancel_debounce = async_call_later(self.hass, self._window_until - now, _later)
 
     # --- refresh button: try source update then refresh ---
     def _mobile_app_identifier_from_entity(self, entity_id: str) -> str | None:
@@ -393,20 +799,39 @@ class AdjacencyManager:
         if not entity_id or entity_id.startswith("zone."):
             return
 
-        mobile_id = self._mobile_app_identifier_from_entity(entity_id)
-        if mobile_id:
-            service = f"mobile_app_{_sanitize_service_suffix(mobile_id)}"
-            if self.hass.services.has_service("notify", service):
+        if entity_id in self._mobile_service_cache:
+            service = self._mobile_service_cache[entity_id]
+        else:
+            mobile_id = self._mobile_app_identifier_from_entity(entity_id)
+            service = f"mobile_app_{_sanitize_service_suffix(mobile_id)}" if mobile_id else None
+            self._mobile_service_cache[entity_id] = service
+        if service and self.hass.services.has_service("notify", service):
+            # Wait for the device to actually post a fresh state instead
+            # of sleeping a fixed 0.3s; most phones answer in well under
+            # 100ms, and the timeout keeps the old worst case.
+            fut: asyncio.Future[None] = self.hass.loop.create_future()
+
+            @callback
+            def _on_update(_event) -> None:
+                if not fut.done():
+                    fut.set_result(None)
+
+            unsub = async_track_state_change_event(self.hass, [entity_id], _on_update)
+            try:
+                await self.hass.services.async_call(
+                    "notify",
+                    service,
+                    {"message": "request_location_update"},
+                    blocking=True,
+                )
                 try:
-                    await self.hass.services.async_call(
-                        "notify",
-                        service,
-                        {"message": "request_location_update"},
-                        blocking=True,
-                    )
-                    await asyncio.sleep(0.3)
-                except Exception:
+                    await asyncio.wait_for(fut, timeout=0.3)
+                except asyncio.TimeoutError:
                     pass
+            except Exception:
+                pass
+            finally:
+                unsub()
 
         if self.hass.services.has_service("homeassistant", "update_entity"):
             try:
@@ -420,8 +845,12 @@ class AdjacencyManager:
                 pass
 
     async def async_force_refresh_with_source_update(self) -> None:
-        await self.async_request_source_update(self.entity_a)
-        await self.async_request_source_update(self.entity_b)
+        # The two source updates are independent RPCs; run them concurrently
+        # so the refresh button only waits for the slower of the two.
+        await asyncio.gather(
+            self.async_request_source_update(self.entity_a),
+            self.async_request_source_update(self.entity_b),
+        )
         await self.async_force_refresh()
 
     async def async_force_refresh(self) -> None:
@@ -432,36 +861,38 @@ class AdjacencyManager:
 
     # --- compute helpers ---
     def _coords_and_acc(self, entity_id: str) -> tuple[tuple[float, float] | None, float | None]:
-        st = self.hass.states.get(entity_id)
-        return _try_get_coords_from_state(st), _get_accuracy_m(st)
-
-    def _count_recent_updates(self, history: list[datetime], window_s: int) -> int:
+        st = self._state_cache.get(entity_id)
+        if st is None:
+            st = self.hass.states.get(entity_id)
+            if st is None:
+                return None, None
+            self._state_cache[entity_id] = st
+        attrs = st.attributes
+        return _coords_from_attrs(attrs, st.state), _acc_from_attrs(attrs)
+
+    def _count_recent_updates(self, history: list[datetime], window_s: int, now: datetime) -> int:
         """지정된 윈도우 내의 업데이트 횟수를 반환."""
-        now = dt_util.utcnow()
         cutoff = now - timedelta(seconds=window_s)
         return sum(1 for ts in history if ts >= cutoff)
 
-    def _prune_history(self, history: list[datetime], window_s: int) -> list[datetime]:
+    def _prune_history(self, history: list[datetime], window_s: int, now: datetime) -> list[datetime]:
         """오래된 항목을 제거하고 윈도우 내의 항목만 유지."""
-        now = dt_util.utcnow()
         cutoff = now - timedelta(seconds=window_s)
         return [ts for ts in history if ts >= cutoff]
 
-    def _record_update(self, side: str) -> None:
+    def _record_update(self, side: str, now: datetime) -> None:
         """업데이트 이력에 현재 시간 기록."""
-        now = dt_util.utcnow()
         if side == "a":
             self.a_update_history.append(now)
-            self.a_update_history = self._prune_history(self.a_update_history, self.update_window_s * 2)
+            self.a_update_history = self._prune_history(self.a_update_history, self.update_window_s * 2, now)
         else:
             self.b_update_history.append(now)
-            self.b_update_history = self._prune_history(self.b_update_history, self.update_window_s * 2)
+            self.b_update_history = self._prune_history(self.b_update_history, self.update_window_s * 2, now)
 
-    def _calculate_convergence_speed(self, current_distance_m: float) -> float | None:
+    def _calculate_convergence_speed(self, current_distance_m: float, now: datetime) -> float | None:
         """두 엔티티가 가까워지는 속도(km/h) 계산. 양수 = 가까워짐, 음수 = 멀어짐."""
         if self._prev_distance_m is None or self._prev_distance_time is None:
             return None
-        now = dt_util.utcnow()
         dt_seconds = (now - self._prev_distance_time).total_seconds()
         if dt_seconds <= 0:
             return None
@@ -471,45 +902,71 @@ class AdjacencyManager:
         speed_kmh = (delta_m / dt_seconds) * 3.6
         return speed_kmh
 
-    def _check_proximity_reliability(self, current_distance_m: float) -> tuple[bool, str | None]:
+    def _check_proximity_reliability(
+        self, current_distance_m: float, now: datetime
+    ) -> tuple[bool, str | None, int, int, float | None]:
         """
         근접 이벤트의 신뢰도를 확인.
 
         Returns:
-            (reliable, reason) - reliable=False이면 reason에 사유 포함
+            (reliable, reason, a_updates, b_updates, convergence_kmh)
+            - reliable=False이면 reason에 사유 포함.  Side effects are left to
+              the caller so the data snapshot can be swapped in one piece.
         """
         # 1. 양쪽 업데이트 빈도 확인
-        a_updates = self._count_recent_updates(self.a_update_history, self.update_window_s)
-        b_updates = self._count_recent_updates(self.b_update_history, self.update_window_s)
+        a_updates = self._count_recent_updates(self.a_update_history, self.update_window_s, now)
+        b_updates = self._count_recent_updates(self.b_update_history, self.update_window_s, now)
 
-        self.data.a_updates_in_window = a_updates
-        self.data.b_updates_in_window = b_updates
+        # 2. 수렴 속도 (거리가 줄어드는 속도) — pure computation, safe up front
+        convergence = self._calculate_convergence_speed(current_distance_m, now)
 
         if a_updates < self.min_updates_for_proximity:
-            return False, f"insufficient_updates_a ({a_updates}<{self.min_updates_for_proximity})"
+            return False, f"insufficient_updates_a ({a_updates}<{self.min_updates_for_proximity})", a_updates, b_updates, convergence
         if b_updates < self.min_updates_for_proximity:
-            return False, f"insufficient_updates_b ({b_updates}<{self.min_updates_for_proximity})"
-
-        # 2. 수렴 속도 확인 (거리가 줄어드는 속도)
-        convergence = self._calculate_convergence_speed(current_distance_m)
-        self.data.convergence_speed_kmh = convergence
+            return False, f"insufficient_updates_b ({b_updates}<{self.min_updates_for_proximity})", a_updates, b_updates, convergence
 
         if convergence is not None:
             # 두 객체가 서로 다가오는 최대 속도 = 양쪽 max_speed 합산
             max_convergence = self.max_speed_kmh * 2
             if convergence > max_convergence:
-                return False, f"unrealistic_convergence ({convergence:.1f} > {max_convergence} km/h)"
+                return False, f"unrealistic_convergence ({convergence:.1f} > {max_convergence} km/h)", a_updates, b_updates, convergence
 
         # 3. resync 상태 확인
-        now = dt_util.utcnow()
         if self.a_resync_until and now < self.a_resync_until:
-            return False, "resync_a"
+            return False, "resync_a", a_updates, b_updates, convergence
         if self.b_resync_until and now < self.b_resync_until:
-            return False, "resync_b"
+            return False, "resync_b", a_updates, b_updates, convergence
+
+        return True, None, a_updates, b_updates, convergence
+
+    def _step(
+        self,
+        now: datetime,
+        coords_a: tuple[float, float] | None,
+        coords_b: tuple[float, float] | None,
+        meters_raw: float,
+    ) -> tuple[str | None, bool, str | None, int, int, float | None]:
+        """Run movement filtering, history bookkeeping and the reliability check.
+
+        One fused entry point so the whole per-refresh pipeline shares a single
+        timestamp.  History is only recorded once both sides pass the movement
+        filter, which is why the stages stay sequential rather than one loop.
+        Returns ``(movement_err, reliable, unreliable_reason, a_updates,
+        b_updates, convergence_kmh)``; everything after ``movement_err`` is
+        only meaningful when it is ``None``.
+        """
+        movement_err = self._update_movement(coords_a, coords_b, now)
+        if movement_err is not None:
+            return movement_err, True, None, 0, 0, None
 
-        return True, None
+        # 업데이트 이력 기록 (유효한 좌표일 때만)
+        self._record_update("a", now)
+        self._record_update("b", now)
 
-    def _update_movement(self, coords_a: tuple[float, float] | None, coords_b: tuple[float, float] | None) -> str | None:
+        # 신뢰도 검사 (proximity 진입 시에만 적용)
+        return (None, *self._check_proximity_reliability(meters_raw, now))
+
+    def _update_movement(self, coords_a: tuple[float, float] | None, coords_b: tuple[float, float] | None, now: datetime) -> str | None:
         """
         Update per-side movement and detect unrealistic movement or resync.
 
@@ -518,7 +975,6 @@ class AdjacencyManager:
         caller should treat the entire update as invalid and refrain from
         updating the distance or firing events.
         """
-        now = dt_util.utcnow()
 
         def process_side(side: str, coords: tuple[float, float] | None) -> str | None:
             # Determine attribute names based on side
@@ -594,7 +1050,7 @@ class AdjacencyManager:
                 return None
 
             # Distance in meters between previous and current coords
-            dist_m = ha_distance(prev_coords[0], prev_coords[1], coords[0], coords[1])
+            dist_m = _fast_distance_m(prev_coords[0], prev_coords[1], coords[0], coords[1])
             speed_kmh = (dist_m / dt_seconds) * 3.6
 
             # Update speed attribute
@@ -624,127 +1080,169 @@ class AdjacencyManager:
             return None
 
         # Process both sides
+        err = None
         for side, coords in (("a", coords_a), ("b", coords_b)):
             err = process_side(side, coords)
             if err:
-                return err
-        return None
+                break
+        self._sync_iso_cache()
+        return err
+
+    def _sync_iso_cache(self) -> None:
+        """Re-render the cached ISO strings after movement bookkeeping."""
+        self.a_last_fix_iso = self.a_last_fix.isoformat() if self.a_last_fix else None
+        self.b_last_fix_iso = self.b_last_fix.isoformat() if self.b_last_fix else None
+        self.a_resync_until_iso = self.a_resync_until.isoformat() if self.a_resync_until else None
+        self.b_resync_until_iso = self.b_resync_until.isoformat() if self.b_resync_until else None
 
     async def async_refresh(self) -> None:
-        """Recompute distance and proximity state."""
-        # dynamic options (may change via options flow)
-        self.entry_th = int(_get(self.entry, CONF_ENTRY_THRESHOLD_M, DEFAULT_ENTRY_THRESHOLD_M))
-        self.exit_th = int(_get(self.entry, CONF_EXIT_THRESHOLD_M, DEFAULT_EXIT_THRESHOLD_M))
-        self.debounce_s = int(_get(self.entry, CONF_DEBOUNCE_SECONDS, DEFAULT_DEBOUNCE_SECONDS))
-        self.max_acc_m = int(_get(self.entry, CONF_MAX_ACCURACY_M, DEFAULT_MAX_ACCURACY_M))
-        self.force_meters = bool(_get(self.entry, CONF_FORCE_METERS, DEFAULT_FORCE_METERS))
-        # dynamic new options
-        self.resync_silence_s = int(_get(self.entry, CONF_RESYNC_SILENCE_S, DEFAULT_RESYNC_SILENCE_S))
-        self.resync_hold_s = int(_get(self.entry, CONF_RESYNC_HOLD_S, DEFAULT_RESYNC_HOLD_S))
-        self.max_speed_kmh = float(_get(self.entry, CONF_MAX_SPEED_KMH, DEFAULT_MAX_SPEED_KMH))
-        self.min_updates_for_proximity = int(_get(self.entry, CONF_MIN_UPDATES_FOR_PROXIMITY, DEFAULT_MIN_UPDATES_FOR_PROXIMITY))
-        self.update_window_s = int(_get(self.entry, CONF_UPDATE_WINDOW_S, DEFAULT_UPDATE_WINDOW_S))
-        self.require_reliable_proximity = bool(_get(self.entry, CONF_REQUIRE_RELIABLE_PROXIMITY, DEFAULT_REQUIRE_RELIABLE_PROXIMITY))
+        """Async wrapper for callers that await a refresh."""
+        self._refresh()
+
+    @callback
+    def _refresh(self) -> None:
+        """Recompute distance and proximity state.
+
+        Pure synchronous work — nothing here awaits — so event-driven callers
+        (debounce expiry, state listeners) invoke it directly without paying
+        for a Task allocation per refresh.
+        """
+        # One timestamp per refresh: every datetime/ISO string derived below
+        # comes from this capture so attributes never skew across the call.
+        now = dt_util.utcnow()
+        now_iso = now.isoformat()
+
+        # advance the shared duration strings even if this run exits early
+        self._update_duration(now)
 
         prev_prox = self.data.proximity
 
         coords_a, acc_a = self._coords_and_acc(self.entity_a)
         coords_b, acc_b = self._coords_and_acc(self.entity_b)
-        self.data.accuracy_a = acc_a
-        self.data.accuracy_b = acc_b
+
+        # Bit-identical inputs (attribute churn, re-reported states) cannot
+        # change any output; skip the whole pipeline including the fan-out.
+        inputs = (coords_a, coords_b, acc_a, acc_b, self.entry_th, self.exit_th, self.max_acc_m)
+        if inputs == self._last_inputs and self.data.data_valid:
+            # still notify: the duration rendering may have advanced
+            self._async_notify()
+            return
 
         # invalid coords => keep last good, mark invalid
         if coords_a is None or coords_b is None:
-            self.data.data_valid = False
-            self.data.last_error = "missing_coords"
-            async_dispatcher_send(self.hass, self.signal)
+            self._swap_invalid(acc_a, acc_b, "missing_coords")
             return
 
         # accuracy filter
         if self.max_acc_m > 0:
-            if acc_a is not None and acc_a > float(self.max_acc_m):
-                self.data.data_valid = False
-                self.data.last_error = "accuracy_filtered_a"
-                async_dispatcher_send(self.hass, self.signal)
+            if acc_a is not None and acc_a > self._max_acc_m_f:
+                self._swap_invalid(acc_a, acc_b, "accuracy_filtered_a")
                 return
-            if acc_b is not None and acc_b > float(self.max_acc_m):
-                self.data.data_valid = False
-                self.data.last_error = "accuracy_filtered_b"
-                async_dispatcher_send(self.hass, self.signal)
+            if acc_b is not None and acc_b > self._max_acc_m_f:
+                self._swap_invalid(acc_a, acc_b, "accuracy_filtered_b")
                 return
 
-        # movement filtering
-        movement_err = self._update_movement(coords_a, coords_b)
+        # Compute distance (meters); reuse the previous result when neither
+        # fix moved (e.g. only accuracy changed)
+        coord_key = (coords_a, coords_b)
+        if self._dist_cache is not None and self._dist_cache[0] == coord_key:
+            meters_raw = self._dist_cache[1]
+        else:
+            lat1, lon1 = coords_a
+            lat2, lon2 = coords_b
+            meters_raw = _fast_distance_m(lat1, lon1, lat2, lon2)
+            self._dist_cache = (coord_key, meters_raw)
+
+        # movement filtering, history bookkeeping and reliability in one pass
+        movement_err, reliable, unreliable_reason, a_upd, b_upd, convergence = self._step(
+            now, coords_a, coords_b, meters_raw
+        )
         if movement_err is not None:
-            # mark data invalid and annotate error
-            self.data.data_valid = False
-            self.data.last_error = movement_err
-            async_dispatcher_send(self.hass, self.signal)
+            self._swap_invalid(acc_a, acc_b, movement_err)
             return
 
-        # 업데이트 이력 기록 (유효한 좌표일 때만)
-        self._record_update("a")
-        self._record_update("b")
-
-        # Compute distance
-        lat1, lon1 = coords_a
-        lat2, lon2 = coords_b
-        # HA Core distance() returns meters
-        meters_raw = float(ha_distance(lat1, lon1, lat2, lon2))
-
-        # 신뢰도 검사 (proximity 진입 시에만 적용)
-        reliable, unreliable_reason = self._check_proximity_reliability(meters_raw)
-        self.data.proximity_reliable = reliable
-        self.data.unreliable_reason = unreliable_reason
+        # Noise floor: stationary phones re-report near-identical fixes many
+        # times per minute.  When the distance moved less than the configured
+        # floor and the hysteresis state cannot flip, record the reading but
+        # skip the dispatcher fan-out and event firing entirely.  _prev_distance_m
+        # is intentionally left untouched so slow drift still accumulates and
+        # eventually passes the floor.  Only taken while the data is already
+        # valid: after an invalid cycle the full pipeline below must run so
+        # data_valid/last_error are restored.
+        if (
+            self.data.data_valid
+            and self.noise_floor_m > 0
+            and self._prev_distance_m is not None
+            and abs(meters_raw - self._prev_distance_m) < self.noise_floor_m
+        ):
+            would_prox = (
+                meters_raw < self._exit_th_f
+                if prev_prox
+                else meters_raw <= self._entry_th_f
+            )
+            if would_prox == prev_prox:
+                self.data = replace(
+                    self.data,
+                    distance_m=meters_raw,
+                    bucket=_bucket(meters_raw),
+                    accuracy_a=acc_a,
+                    accuracy_b=acc_b,
+                    last_valid_updated=now_iso,
+                    # _step already ran this tick; keep its results current
+                    proximity_reliable=reliable,
+                    unreliable_reason=unreliable_reason,
+                    a_updates_in_window=a_upd,
+                    b_updates_in_window=b_upd,
+                    convergence_speed_kmh=convergence,
+                )
+                self.version += 1
+                self._last_inputs = inputs
+                # no event firing, but the duration rendering may have
+                # advanced — let the snapshot dedup decide the fan-out
+                self._async_notify()
+                return
 
         # 이전 거리 저장 (수렴 속도 계산용)
         self._prev_distance_m = meters_raw
-        self._prev_distance_time = dt_util.utcnow()
+        self._prev_distance_time = now
 
-        self.data.distance_m = meters_raw
-        self.data.bucket = _bucket(meters_raw)
-        self.data.data_valid = True
-        self.data.last_error = None
-        self.data.last_valid_updated = dt_util.utcnow().isoformat()
+        # round() on a float already returns int; no extra coercion needed
+        dm_int = round(meters_raw)
 
         # hysteresis uses raw meters
-        if prev_prox:
-            prox = meters_raw < float(self.exit_th)
-        else:
-            prox = meters_raw <= float(self.entry_th)
+        prox = meters_raw < self._exit_th_f if prev_prox else meters_raw <= self._entry_th_f
+
+        # Event bookkeeping collects into locals; all data fields land in one
+        # snapshot swap below so readers never see distance/bucket/proximity
+        # half-updated mid-refresh.
+        update_count = self.data.proximity_update_count
+        last_changed = self.data.last_changed
+        last_entered = self.data.last_entered
+        last_left = self.data.last_left
 
         if prox != prev_prox:
-            now_iso = dt_util.utcnow().isoformat()
-            self.data.last_changed = now_iso
+            last_changed = now_iso
 
             if prox:
                 # proximity entered: reset update_count to 1
-                self.data.proximity_update_count = 1
-                self.data.last_entered = now_iso
-                self._proximity_since = dt_util.utcnow()
+                update_count = 1
+                last_entered = now_iso
+                self._proximity_since = now
 
                 # Determine which event to fire based on reliability and config
                 event_data = {
-                    # New semantic naming (v1.4+)
-                    "base_entity": self.base_entity,
-                    "tracker_entity": self.tracker_entity,
-                    # Legacy keys (backward compatibility)
-                    "entity_a": self.entity_a,
-                    "entity_b": self.entity_b,
-                    # Distance and thresholds
-                    "distance_m": int(round(meters_raw)),
-                    "entry_threshold_m": self.entry_th,
-                    "exit_threshold_m": self.exit_th,
+                    **self._payload_thresholds,
+                    "distance_m": dm_int,
                     "proximity_update_count": 1,
                     # 신뢰도 정보
                     "proximity_reliable": reliable,
                     "unreliable_reason": unreliable_reason,
-                    "base_updates_in_window": self.data.a_updates_in_window,
-                    "tracker_updates_in_window": self.data.b_updates_in_window,
+                    "base_updates_in_window": a_upd,
+                    "tracker_updates_in_window": b_upd,
                     # Legacy aliases
-                    "a_updates_in_window": self.data.a_updates_in_window,
-                    "b_updates_in_window": self.data.b_updates_in_window,
-                    "convergence_speed_kmh": round(self.data.convergence_speed_kmh, 1) if self.data.convergence_speed_kmh else None,
+                    "a_updates_in_window": a_upd,
+                    "b_updates_in_window": b_upd,
+                    "convergence_speed_kmh": round(convergence, 1) if convergence else None,
                 }
 
                 if self.require_reliable_proximity and not reliable:
@@ -757,11 +1255,8 @@ class AdjacencyManager:
                     self.hass.bus.async_fire(
                         EVENT_PROXIMITY_UPDATE,
                         {
-                            "base_entity": self.base_entity,
-                            "tracker_entity": self.tracker_entity,
-                            "entity_a": self.entity_a,
-                            "entity_b": self.entity_b,
-                            "distance_m": int(round(meters_raw)),
+                            **self._payload_base,
+                            "distance_m": dm_int,
                             "proximity_update_count": 1,
                             "is_first_update": True,
                             "proximity_reliable": reliable,
@@ -770,35 +1265,27 @@ class AdjacencyManager:
                     )
             else:
                 # proximity left: reset update_count
-                self.data.proximity_update_count = 0
-                self.data.last_left = now_iso
+                update_count = 0
+                last_left = now_iso
                 self._proximity_since = None
                 self.hass.bus.async_fire(
                     EVENT_LEAVE,
                     {
-                        "base_entity": self.base_entity,
-                        "tracker_entity": self.tracker_entity,
-                        "entity_a": self.entity_a,
-                        "entity_b": self.entity_b,
-                        "distance_m": int(round(meters_raw)),
-                        "entry_threshold_m": self.entry_th,
-                        "exit_threshold_m": self.exit_th,
+                        **self._payload_thresholds,
+                        "distance_m": dm_int,
                     },
                 )
         elif prox:
             # already in proximity: increment update count
-            self.data.proximity_update_count += 1
+            update_count += 1
             # Only fire proximity update if reliable OR enforcement is disabled
             if not self.require_reliable_proximity or reliable:
                 self.hass.bus.async_fire(
                     EVENT_PROXIMITY_UPDATE,
                     {
-                        "base_entity": self.base_entity,
-                        "tracker_entity": self.tracker_entity,
-                        "entity_a": self.entity_a,
-                        "entity_b": self.entity_b,
-                        "distance_m": int(round(meters_raw)),
-                        "proximity_update_count": self.data.proximity_update_count,
+                        **self._payload_base,
+                        "distance_m": dm_int,
+                        "proximity_update_count": update_count,
                         "is_first_update": False,
                         "proximity_reliable": reliable,
                         "unreliable_reason": unreliable_reason,
@@ -806,9 +1293,31 @@ class AdjacencyManager:
                 )
 
         if prox and self._proximity_since is None:
-            self._proximity_since = dt_util.utcnow()
+            self._proximity_since = now
         if not prox:
             self._proximity_since = None
 
-        self.data.proximity = prox
-        async_dispatcher_send(self.hass, self.signal)
\ No newline at end of file
+        self.data = replace(
+            self.data,
+            distance_m=meters_raw,
+            bucket=_bucket(meters_raw),
+            proximity=prox,
+            data_valid=True,
+            last_valid_updated=now_iso,
+            last_error=None,
+            last_changed=last_changed,
+            last_entered=last_entered,
+            last_left=last_left,
+            accuracy_a=acc_a,
+            accuracy_b=acc_b,
+            proximity_update_count=update_count,
+            proximity_reliable=reliable,
+            unreliable_reason=unreliable_reason,
+            a_updates_in_window=a_upd,
+            b_updates_in_window=b_upd,
+            convergence_speed_kmh=convergence,
+        )
+        self.version += 1
+        self._update_duration(now)
+        self._last_inputs = inputs
+        self._async_notify()
\ No newline at end of file
@@ -20,16 +20,17 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfLength
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import DOMAIN, DEFAULT_NAME_KO
 from .manager import AdjacencyManager
 
 
-def _round1(x: float) -> float:
-    return round(float(x), 1)
+def _round1(x: float, _r=round) -> float:
+    # values reaching here are already floats; skip the float() coercion and
+    # resolve round once at definition time
+    return _r(x, 1)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
@@ -39,35 +40,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     ent_reg = er.async_get(hass)
     pair_key = mgr.pair_key
 
-    # Ensure all sensor entities are created in the entity registry
-    ent_reg.async_get_or_create(
-        "sensor",
-        DOMAIN,
-        f"{entry.entry_id}_distance",
-        suggested_object_id=f"member_adjacency_{pair_key}",
-        config_entry=entry,
-    )
-    ent_reg.async_get_or_create(
-        "sensor",
-        DOMAIN,
-        f"{entry.entry_id}_bucket",
-        suggested_object_id=f"member_adjacency_{pair_key}_bucket",
-        config_entry=entry,
-    )
-    ent_reg.async_get_or_create(
-        "sensor",
-        DOMAIN,
-        f"{entry.entry_id}_proximity_duration",
-        suggested_object_id=f"member_adjacency_{pair_key}_proximity_duration",
-        config_entry=entry,
+    # Ensure all sensor entities are created in the entity registry.  The
+    # cheap lookup first avoids async_get_or_create's create path (entry
+    # validation + registry event) on every reload once the entities exist.
+    specs = (
+        (f"{entry.entry_id}_distance", f"member_adjacency_{pair_key}"),
+        (f"{entry.entry_id}_bucket", f"member_adjacency_{pair_key}_bucket"),
+        (f"{entry.entry_id}_proximity_duration", f"member_adjacency_{pair_key}_proximity_duration"),
     )
+    for unique_id, object_id in specs:
+        if ent_reg.async_get_entity_id("sensor", DOMAIN, unique_id) is None:
+            ent_reg.async_get_or_create(
+                "sensor",
+                DOMAIN,
+                unique_id,
+                suggested_object_id=object_id,
+                config_entry=entry,
+            )
     # Note: Speed sensors removed in v1.4.1 - speed info available as attributes
 
+    # Resolve the pair's display names once for all three entities
+    pair_name = f"{mgr.get_tracker_name()} → {mgr.get_base_name()}"
+
     async_add_entities(
         [
-            MemberAdjacencyDistanceSensor(mgr),
-            MemberAdjacencyBucketSensor(mgr),
-            MemberAdjacencyProximityDurationSensor(mgr),
+            MemberAdjacencyDistanceSensor(mgr, pair_name),
+            MemberAdjacencyBucketSensor(mgr, pair_name),
+            MemberAdjacencyProximityDurationSensor(mgr, pair_name),
         ]
     )
 
@@ -75,6 +74,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 class _Base(SensorEntity):
     """Base class for all Member Adjacency sensors."""
 
+    # Entity itself still carries __dict__, but slotting our own attributes
+    # keeps them on fixed offsets and out of the per-instance dict
+    __slots__ = ("mgr", "_unsub")
+
     _attr_should_poll = False
 
     def __init__(self, mgr: AdjacencyManager) -> None:
@@ -82,11 +85,9 @@ class _Base(SensorEntity):
         self._unsub = None
 
     async def async_added_to_hass(self) -> None:
-        @callback
-        def _updated() -> None:
-            self.async_write_ha_state()
-
-        self._unsub = async_dispatcher_connect(self.hass, self.mgr.signal, _updated)
+        # async_write_ha_state is itself a @callback; register the bound
+        # method directly rather than allocating a closure per entity
+        self._unsub = self.mgr.async_add_listener(self.async_write_ha_state)
         self.async_on_remove(self._unsub)
 
     @property
@@ -104,61 +105,63 @@ class _Base(SensorEntity):
         return v, u, f"{v} km"
 
     def _common_attrs(self) -> dict[str, Any]:
-        """Attributes common to all adjacency sensors."""
-        d_m = self.mgr.data.distance_m
+        """Attributes common to all adjacency sensors.
+
+        Cached on the manager per data version: the first sensor to render
+        after a swap builds the dict, the others reuse it.
+        """
+        mgr = self.mgr
+        cached = mgr.attrs_cache
+        if cached is not None and cached[0] == mgr.version:
+            return cached[1]
+        data = mgr.data
+        d_m = data.distance_m
         display_value = None
         display_unit = None
         display_text = None
         if d_m is not None:
-            dv, du, dt = self._display(d_m)
-            display_value = dv
-            display_unit = du
-            display_text = dt
-
-        return {
+            display_value, display_unit, display_text = self._display(d_m)
+
+        # Each shared value is computed once; the legacy-alias keys reference
+        # the same objects instead of re-deriving them.  (A lazy alias-mapping
+        # was considered but the recorder/JSON encoders read the raw dict, so
+        # both key sets must be materialized.)
+        speed_a = None if mgr.a_speed_kmh is None else _round1(mgr.a_speed_kmh)
+        speed_b = None if mgr.b_speed_kmh is None else _round1(mgr.b_speed_kmh)
+        acc_a = None if data.accuracy_a is None else _round1(data.accuracy_a)
+        acc_b = None if data.accuracy_b is None else _round1(data.accuracy_b)
+        a_fix = mgr.a_last_fix_iso
+        b_fix = mgr.b_last_fix_iso
+
+        attrs = {
+            # entity ids + configuration (rebuilt only on options change)
+            **mgr.static_attrs,
             # New semantic naming (기준점/추적대상)
-            "base_entity": self.mgr.base_entity,
-            "tracker_entity": self.mgr.tracker_entity,
-            "base_speed_kmh": None if self.mgr.a_speed_kmh is None else _round1(self.mgr.a_speed_kmh),
-            "tracker_speed_kmh": None if self.mgr.b_speed_kmh is None else _round1(self.mgr.b_speed_kmh),
-            "base_accuracy_m": None if self.mgr.data.accuracy_a is None else _round1(self.mgr.data.accuracy_a),
-            "tracker_accuracy_m": None if self.mgr.data.accuracy_b is None else _round1(self.mgr.data.accuracy_b),
-            "base_last_update": self.mgr.a_last_fix.isoformat() if self.mgr.a_last_fix else None,
-            "tracker_last_update": self.mgr.b_last_fix.isoformat() if self.mgr.b_last_fix else None,
-            "base_updates_recent": self.mgr.data.a_updates_in_window,
-            "tracker_updates_recent": self.mgr.data.b_updates_in_window,
+            "base_speed_kmh": speed_a,
+            "tracker_speed_kmh": speed_b,
+            "base_accuracy_m": acc_a,
+            "tracker_accuracy_m": acc_b,
+            "base_last_update": a_fix,
+            "tracker_last_update": b_fix,
+            "base_updates_recent": data.a_updates_in_window,
+            "tracker_updates_recent": data.b_updates_in_window,
 
             # Legacy aliases (for backward compatibility)
-            "entity_a": self.mgr.base_entity,
-            "entity_b": self.mgr.tracker_entity,
-            "speed_a_kmh": None if self.mgr.a_speed_kmh is None else _round1(self.mgr.a_speed_kmh),
-            "speed_b_kmh": None if self.mgr.b_speed_kmh is None else _round1(self.mgr.b_speed_kmh),
-            "accuracy_a": None if self.mgr.data.accuracy_a is None else _round1(self.mgr.data.accuracy_a),
-            "accuracy_b": None if self.mgr.data.accuracy_b is None else _round1(self.mgr.data.accuracy_b),
-            "a_last_fix": self.mgr.a_last_fix.isoformat() if self.mgr.a_last_fix else None,
-            "b_last_fix": self.mgr.b_last_fix.isoformat() if self.mgr.b_last_fix else None,
-            "a_resync_until": self.mgr.a_resync_until.isoformat() if self.mgr.a_resync_until else None,
-            "b_resync_until": self.mgr.b_resync_until.isoformat() if self.mgr.b_resync_until else None,
-            "a_updates_in_window": self.mgr.data.a_updates_in_window,
-            "b_updates_in_window": self.mgr.data.b_updates_in_window,
-
-            # Configuration
-            "entry_threshold_m": self.mgr.entry_th,
-            "exit_threshold_m": self.mgr.exit_th,
-            "debounce_seconds": self.mgr.debounce_s,
-            "max_accuracy_m": self.mgr.max_acc_m,
-            "force_meters": self.mgr.force_meters,
-            # movement/resync configuration
-            "resync_silence_s": self.mgr.resync_silence_s,
-            "resync_hold_s": self.mgr.resync_hold_s,
-            "max_speed_kmh": self.mgr.max_speed_kmh,
-            "min_updates_for_proximity": self.mgr.min_updates_for_proximity,
-            "update_window_s": self.mgr.update_window_s,
+            "speed_a_kmh": speed_a,
+            "speed_b_kmh": speed_b,
+            "accuracy_a": acc_a,
+            "accuracy_b": acc_b,
+            "a_last_fix": a_fix,
+            "b_last_fix": b_fix,
+            "a_resync_until": mgr.a_resync_until_iso,
+            "b_resync_until": mgr.b_resync_until_iso,
+            "a_updates_in_window": data.a_updates_in_window,
+            "b_updates_in_window": data.b_updates_in_window,
 
             # State
-            "data_valid": self.mgr.data.data_valid,
-            "last_valid_updated": self.mgr.data.last_valid_updated,
-            "last_error": self.mgr.data.last_error,
+            "data_valid": data.data_valid,
+            "last_valid_updated": data.last_valid_updated,
+            "last_error": data.last_error,
 
             # raw distance values
             "distance_m": None if d_m is None else _round1(d_m),
@@ -170,38 +173,39 @@ class _Base(SensorEntity):
             "display_text": display_text,
 
             # 신뢰도 정보
-            "proximity_reliable": self.mgr.data.proximity_reliable,
-            "unreliable_reason": self.mgr.data.unreliable_reason,
-            "convergence_speed_kmh": None if self.mgr.data.convergence_speed_kmh is None else _round1(self.mgr.data.convergence_speed_kmh),
-
-            "bucket": self.mgr.data.bucket,
-            "proximity": self.mgr.data.proximity,
-            "proximity_update_count": self.mgr.data.proximity_update_count,
-            "proximity_duration_min": _round1(self.mgr.proximity_duration_minutes()),
-            "proximity_duration_human": self.mgr.proximity_duration_human(),
-            "last_changed": self.mgr.data.last_changed,
-            "last_entered": self.mgr.data.last_entered,
-            "last_left": self.mgr.data.last_left,
+            "proximity_reliable": data.proximity_reliable,
+            "unreliable_reason": data.unreliable_reason,
+            "convergence_speed_kmh": None if data.convergence_speed_kmh is None else _round1(data.convergence_speed_kmh),
+
+            "bucket": data.bucket,
+            "proximity": data.proximity,
+            "proximity_update_count": data.proximity_update_count,
+            "proximity_duration_min": _round1(mgr.proximity_duration_minutes()),
+            "proximity_duration_human": mgr.proximity_duration_human(),
+            "last_changed": data.last_changed,
+            "last_entered": data.last_entered,
+            "last_left": data.last_left,
         }
+        mgr.attrs_cache = (mgr.version, attrs)
+        return attrs
 
 
 class MemberAdjacencyDistanceSensor(_Base):
     """Sensor reporting the raw distance between two entities in meters."""
 
+    __slots__ = ()
+
     _attr_device_class = SensorDeviceClass.DISTANCE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:arrow-left-right"
+    # always store meters as native unit (statistics stable)
+    _attr_native_unit_of_measurement = UnitOfLength.METERS
 
-    def __init__(self, mgr: AdjacencyManager) -> None:
+    def __init__(self, mgr: AdjacencyManager, pair_name: str) -> None:
         super().__init__(mgr)
         self._attr_unique_id = f"{mgr.entry.entry_id}_distance"
         # Use actual entity names: "바비 → 집 거리"
-        self._attr_name = f"{mgr.get_tracker_name()} → {mgr.get_base_name()} 거리"
-
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        # always store meters as native unit (statistics stable)
-        return UnitOfLength.METERS
+        self._attr_name = f"{pair_name} 거리"
 
     @property
     def native_value(self) -> float | None:
@@ -218,12 +222,14 @@ class MemberAdjacencyDistanceSensor(_Base):
 class MemberAdjacencyBucketSensor(_Base):
     """Sensor reporting the named bucket for the current distance."""
 
+    __slots__ = ()
+
     _attr_icon = "mdi:map-marker-distance"
 
-    def __init__(self, mgr: AdjacencyManager) -> None:
+    def __init__(self, mgr: AdjacencyManager, pair_name: str) -> None:
         super().__init__(mgr)
         self._attr_unique_id = f"{mgr.entry.entry_id}_bucket"
-        self._attr_name = f"{mgr.get_tracker_name()} → {mgr.get_base_name()} 구간"
+        self._attr_name = f"{pair_name} 구간"
 
     @property
     def native_value(self) -> str | None:
@@ -237,12 +243,14 @@ class MemberAdjacencyBucketSensor(_Base):
 class MemberAdjacencyProximityDurationSensor(_Base):
     """Sensor reporting the duration of the current proximity state."""
 
+    __slots__ = ()
+
     _attr_icon = "mdi:timer-outline"
 
-    def __init__(self, mgr: AdjacencyManager) -> None:
+    def __init__(self, mgr: AdjacencyManager, pair_name: str) -> None:
         super().__init__(mgr)
         self._attr_unique_id = f"{mgr.entry.entry_id}_proximity_duration"
-        self._attr_name = f"{mgr.get_tracker_name()} → {mgr.get_base_name()} 근접 지속시간"
+        self._attr_name = f"{pair_name} 근접 지속시간"
 
     @property
     def native_value(self) -> str: